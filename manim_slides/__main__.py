@@ -11,7 +11,12 @@ from .present import list_scenes, present
 from .wizard import init, wizard
 
 
-@click.group(cls=DefaultGroup, default="present", default_if_no_args=True)
+@click.group(
+    cls=DefaultGroup,
+    default="present",
+    default_if_no_args=True,
+    context_settings={"auto_envvar_prefix": "MANIM_SLIDES"},
+)
 @click.option(
     "--notify-outdated-version/--silent",
     " /-S",
@@ -26,6 +31,9 @@ def cli(notify_outdated_version: bool) -> None:
     Manim Slides command-line utilities.
 
     If no command is specified, defaults to `present`.
+
+    Any option can also be set with an environment variable named after
+    the command and the option, e.g., `MANIM_SLIDES_PRESENT_FULL_SCREEN=1`.
     """
     # Code below is mostly a copy from:
     # https://github.com/ManimCommunity/manim/blob/main/manim/cli/render/commands.py
@@ -1,4 +1,3 @@
-import json
 import shutil
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
@@ -10,6 +9,7 @@ from pydantic import (
     FilePath,
     PositiveInt,
     PrivateAttr,
+    ValidationInfo,
     field_validator,
     model_validator,
 )
@@ -193,6 +193,16 @@ class SlideConfig(BaseModel):  # type: ignore[misc]
     auto_next: bool = False,
     notes: str = ""
 
+    @field_validator("file", "rev_file", mode="before")
+    @classmethod
+    def resolve_relative_to_parent(cls, path: Any, info: ValidationInfo) -> Any:
+        """Resolve paths relative to the ``parent`` folder in validation context."""
+        if path and info.context and (parent := info.context.get("parent")):
+            # In JSON mode, FilePath only accepts strings
+            return str(Path(parent) / path)
+
+        return path
+
     @classmethod
     def from_pre_slide_config_and_files(
         cls, pre_slide_config: PreSlideConfig, file: Path, rev_file: Path, thumbnail: Path, notes: str
@@ -215,20 +225,23 @@ class PresentationConfig(BaseModel):  # type: ignore[misc]
     @classmethod
     def from_file(cls, path: Path) -> "PresentationConfig":
         """Read a presentation configuration from a file."""
-        with open(path) as f:
-            obj = json.load(f)
-
-            slides = obj.setdefault("slides", [])
-            parent = path.parent.parent  # Never fails, but parents[1] can fail
+        parent = path.parent.parent  # Never fails, but parents[1] can fail
+        return cls.from_bytes(path.read_bytes(), parent=parent)
 
-            for slide in slides:
-                if file := slide.get("file", None):
-                    slide["file"] = parent / file
-
-                if rev_file := slide.get("rev_file", None):
-                    slide["rev_file"] = parent / rev_file
-
-            return cls.model_validate(obj)  # type: ignore
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, parent: Optional[Path] = None
+    ) -> "PresentationConfig":
+        """
+        Read a presentation configuration from JSON-encoded bytes.
+
+        The JSON is directly parsed and validated by pydantic-core, without
+        building an intermediate Python object.
+
+        :param data: The JSON content, e.g., as read from a file.
+        :param parent: If set, relative slide files are resolved from this folder.
+        """
+        return cls.model_validate_json(data, context={"parent": parent})  # type: ignore
 
     def to_file(self, path: Path) -> None:
         """Dump the presentation configuration to a file."""
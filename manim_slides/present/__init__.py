@@ -1,24 +1,29 @@
+import hashlib
 import json
+import os
+import re
 import signal
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 import click
 from click import Context, Parameter
-from pydantic import ValidationError
-from PySide6.QtCore import Qt
 
 from ..commons import config_path_option, folder_path_option, verbosity_option
 from ..config import Config, PresentationConfig
 from ..logger import logger
-from ..qt_utils import qapp
-from .player import Player
 
-ASPECT_RATIO_MODES = {
-    "keep": Qt.KeepAspectRatio,
-    "ignore": Qt.IgnoreAspectRatio,
-}
+_SCENE_SELECTION_RE = re.compile(r"^\s*\d+(?:\s*,\s*\d+)*\s*$")
+_REQUIRED_KEYS = frozenset(("slides",))
+_MANIFEST_VERSION = 2
+_NO_START_AT: Tuple[Optional[int], Optional[int]] = (None, None)
 
 
 @click.command()
@@ -27,61 +32,218 @@ ASPECT_RATIO_MODES = {
 @verbosity_option
 def list_scenes(folder: Path) -> None:
     """List available scenes."""
-    for i, scene in enumerate(_list_scenes(folder), start=1):
+    for i, scene in enumerate(_iter_scenes(folder), start=1):
         click.secho(f"{i}: {scene}", fg="green")
 
 
-def _list_scenes(folder: Path) -> List[str]:
-    """List available scenes in given directory."""
-    scenes = []
+@lru_cache(maxsize=32)
+def _load_presentation_config(
+    path: str, mtime_ns: int, size: int
+) -> PresentationConfig:
+    """
+    Read a presentation configuration from a file, caching the result.
+
+    The modification time and the size of the file are part of the cache key,
+    so that any change to the file invalidates the cached configuration.
+    The returned configuration is shared between calls and must not be mutated.
+    """
+    return PresentationConfig.from_file(Path(path))
+
+
+def _read_presentation_config(path: str) -> PresentationConfig:
+    """
+    Read a presentation configuration from a file, parsing it at most once.
+
+    This matters for long-lived processes, e.g., Sphinx or IPython, that load
+    the same presentations repeatedly. A copy is returned, as callers like
+    :meth:`PresentationConfig.copy_to` modify the configuration in place.
+    """
+    st = os.stat(path)
+    return _load_presentation_config(path, st.st_mtime_ns, st.st_size).model_copy(
+        deep=True
+    )
 
-    for filepath in folder.glob("*.json"):
-        try:
-            _ = PresentationConfig.from_file(filepath)
-            scenes.append(filepath.stem)
-        except (
-            Exception
-        ) as e:  # Could not parse this file as a proper presentation config
-            logger.warn(
-                f"Something went wrong with parsing presentation config `{filepath}`: {e}"
-            )
 
-    logger.debug(f"Found {len(scenes)} valid scene configuration files in `{folder}`.")
+def _is_scene_config(path: str) -> Optional[bool]:
+    """
+    Cheaply check if a file looks like a scene configuration.
+
+    Only the top-level keys are checked, so the file is not validated against
+    :class:`PresentationConfig<manim_slides.config.PresentationConfig>`.
+    Return :data:`None` if the file could not be parsed at all.
+    """
+    try:
+        with open(path, "rb") as f:
+            obj = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    return isinstance(obj, dict) and _REQUIRED_KEYS.issubset(obj)
 
-    return scenes
+
+def _cache_dir() -> Path:
+    """
+    Return the directory where Manim Slides stores its caches.
+
+    It can be overridden with the ``MANIM_SLIDES_CACHE_DIR`` environment variable.
+    """
+    if cache_dir := os.environ.get("MANIM_SLIDES_CACHE_DIR"):
+        return Path(cache_dir)
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+
+    return Path(base) / "manim-slides"
+
+
+def _manifest_path(folder: Path) -> Path:
+    """Return the path of the scenes manifest of a given directory."""
+    key = hashlib.sha256(os.fsencode(os.path.abspath(folder))).hexdigest()
+    return _cache_dir() / "manifests" / f"{key}.json"
+
+
+def _read_manifest(folder: Path) -> Dict[str, List[Any]]:
+    """
+    Read the scenes manifest of a given directory.
+
+    The manifest maps each JSON file name to its modification time, its size,
+    and whether it looks like a scene configuration, or :data:`None` if it
+    could not be parsed.
+    Return an empty mapping if the manifest is missing or cannot be used.
+    """
+    try:
+        manifest = json.loads(_manifest_path(folder).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != _MANIFEST_VERSION
+        or not isinstance(manifest.get("entries"), dict)
+    ):
+        return {}
+
+    return manifest["entries"]  # type: ignore
+
+
+def _write_manifest(folder: Path, entries: Dict[str, List[Any]]) -> None:
+    """Atomically write the scenes manifest of a given directory."""
+    manifest = {"version": _MANIFEST_VERSION, "entries": entries}
+    path = _manifest_path(folder)
+    f = None
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, prefix=path.name, delete=False
+        ) as f:
+            json.dump(manifest, f)
+
+        os.replace(f.name, path)
+    except OSError as e:  # E.g., a read-only cache, the manifest is optional
+        logger.debug("Could not write the scenes manifest of `%s`: %s", folder, e)
+
+        if f is not None:
+            with suppress(OSError):
+                os.unlink(f.name)
+
+
+def _iter_scenes(folder: Path) -> Iterator[str]:
+    """
+    Iterate over available scenes in given directory.
+
+    Files are only checked to look like scene configurations: their content
+    is validated later, when they are actually loaded.
+    The result of this check is stored in a manifest in the cache directory,
+    so that unchanged files are not read again on the next launch.
+    Files that could not be parsed are recorded too, but reported every time.
+    """
+    n_scenes = 0
+    invalid = []
+    manifest = _read_manifest(folder)
+    entries: Dict[str, List[Any]] = {}
+
+    # A single directory pass, whose entries cache their file type
+    with os.scandir(folder) as it:
+        for entry in it:
+            if (
+                not entry.name.endswith(".json")
+                or entry.name.startswith(".")
+                or not entry.is_file()
+            ):
+                continue
+
+            st = entry.stat()
+            cached = manifest.get(entry.name)
+
+            if cached and cached[:2] == [st.st_mtime_ns, st.st_size]:
+                is_scene_config = cached[2]
+            else:
+                is_scene_config = _is_scene_config(entry.path)
+
+            if is_scene_config is None:
+                invalid.append(entry.name)
+
+            entries[entry.name] = [st.st_mtime_ns, st.st_size, is_scene_config]
+
+            if is_scene_config:
+                n_scenes += 1
+                yield entry.name[: -len(".json")]
+
+    if entries != manifest:
+        _write_manifest(folder, entries)
+
+    if invalid:
+        logger.warning(
+            "Could not parse %d JSON file(s) in `%s`: %s",
+            len(invalid),
+            folder,
+            ", ".join(invalid),
+        )
+
+    logger.debug("Found %d scene configuration files in `%s`.", n_scenes, folder)
 
 
 def prompt_for_scenes(folder: Path) -> List[str]:
     """Prompt the user to select scenes within a given folder."""
-    scene_choices = dict(enumerate(_list_scenes(folder), start=1))
+    scene_choices = {}
 
-    for i, scene in scene_choices.items():
+    for i, scene in enumerate(_iter_scenes(folder), start=1):
         click.secho(f"{i}: {scene}", fg="green")
+        scene_choices[i] = scene
 
-    click.echo()
+    click.echo(
+        "\nChoose number corresponding to desired scene/arguments."
+        "\n(Use comma separated list for multiple entries)"
+    )
 
-    click.echo("Choose number corresponding to desired scene/arguments.")
-    click.echo("(Use comma separated list for multiple entries)")
+    n_choices = len(scene_choices)
 
     def value_proc(value: Optional[str]) -> List[str]:
-        indices = list(map(int, (value or "").strip().replace(" ", "").split(",")))
+        if not value or not _SCENE_SELECTION_RE.match(value):
+            raise click.UsageError(
+                "Please enter a comma separated list of numbers, e.g., 1,2,3."
+            )
+
+        indices = [int(i) for i in value.split(",")]
 
-        if not all(0 < i <= len(scene_choices) for i in indices):
+        if any(i <= 0 or i > n_choices for i in indices):
             raise click.UsageError("Please only enter numbers displayed on the screen.")
 
         return [scene_choices[i] for i in indices]
 
-    if len(scene_choices) == 0:
+    if n_choices == 0:
         raise click.UsageError(
             "No scenes were found, are you in the correct directory?"
         )
 
-    while True:
-        try:
-            scenes = click.prompt("Choice(s)", value_proc=value_proc)
-            return scenes  # type: ignore
-        except ValueError as e:
-            raise click.UsageError(str(e)) from None
+    # Usage errors raised by value_proc make click prompt again
+    return click.prompt("Choice(s)", value_proc=value_proc)  # type: ignore
 
 
 def get_scenes_presentation_config(
@@ -91,26 +253,55 @@ def get_scenes_presentation_config(
     if len(scenes) == 0:
         scenes = prompt_for_scenes(folder)
 
-    presentation_configs = []
-    for scene in scenes:
-        config_file = folder / f"{scene}.json"
-        if not config_file.exists():
-            raise click.UsageError(
-                f"File {config_file} does not exist, check the scene name and make sure to use Slide as your scene base class"
-            )
+    return _load_configs_strict(scenes, folder)
+
+
+def _load_configs_strict(
+    scenes: List[str], folder: Path
+) -> List[PresentationConfig]:
+    """
+    Return the presentation configurations of the given scenes.
+
+    Only the files of the given scenes are read, and all missing files are
+    reported at once, before any of them is validated.
+    """
+    from pydantic import ValidationError
+
+    folder_str = os.fspath(folder)
+    config_files = [os.path.join(folder_str, scene + ".json") for scene in scenes]
+
+    if missing := [
+        config_file for config_file in config_files if not os.path.isfile(config_file)
+    ]:
+        if len(missing) == 1:
+            msg = f"File {missing[0]} does not exist"
+        else:
+            msg = f"Files {', '.join(missing)} do not exist"
+
+        raise click.UsageError(
+            f"{msg}, check the scene name and make sure to use Slide as your scene base class"
+        )
+
+    def load(config_file: str) -> PresentationConfig:
         try:
-            presentation_configs.append(PresentationConfig.from_file(config_file))
-        except ValidationError as e:
+            return _read_presentation_config(config_file)
+        except ValidationError as e:  # Also raised on invalid JSON
             raise click.UsageError(str(e)) from None
 
-    return presentation_configs
+    if len(config_files) <= 1:
+        return [load(config_file) for config_file in config_files]
+
+    # Reading and validating files are independent, so we overlap them.
+    # Results are collected in submission order, to preserve scenes order.
+    with ThreadPoolExecutor(max_workers=min(8, len(config_files))) as executor:
+        return list(executor.map(load, config_files))
 
 
 def start_at_callback(
     ctx: Context, param: Parameter, values: str
-) -> Tuple[Optional[int], ...]:
+) -> Tuple[Optional[int], Optional[int]]:
     if values == "(None, None)":
-        return (None, None)
+        return _NO_START_AT
 
     def str_to_int_or_none(value: str) -> Optional[int]:
         if value.lower().strip() == "":
@@ -125,28 +316,42 @@ def start_at_callback(
                     param=param,
                 ) from None
 
-    values_tuple = values.split(",")
-    n_values = len(values_tuple)
-    if n_values == 2:
-        return tuple(map(str_to_int_or_none, values_tuple))
+    parts = values.split(",")
+    if len(parts) != 2:
+        raise click.BadParameter(
+            f"exactly 2 arguments are expected but you gave {len(parts)}, please use commas to separate them",
+            ctx=ctx,
+            param=param,
+        )
+
+    return (str_to_int_or_none(parts[0]), str_to_int_or_none(parts[1]))
+
 
-    raise click.BadParameter(
-        f"exactly 2 arguments are expected but you gave {n_values}, please use commas to separate them",
-        ctx=ctx,
-        param=param,
+def _aspect_ratio_modes() -> Mapping[str, Any]:
+    """Return a read-only mapping from aspect ratio choices to Qt modes."""
+    from PySide6.QtCore import Qt
+
+    return MappingProxyType(
+        {
+            "keep": Qt.KeepAspectRatio,
+            "ignore": Qt.IgnoreAspectRatio,
+        }
     )
 
 
-def get_screen(app, number: Optional[int]):
+def get_screen(app, number: Optional[int], screens: Optional[List[Any]] = None):
     if number is None:
         return None
 
+    if screens is None:
+        screens = app.screens()
+
     try:
-        return app.screens()[number]
+        return screens[number]
     except IndexError:
         logger.error(
             f"Invalid screen number {number}, "
-            f"allowed values are from 0 to {len(app.screens()) - 1} (incl.)"
+            f"allowed values are from 0 to {len(screens) - 1} (incl.)"
         )
         return None
 
@@ -189,7 +394,7 @@ def get_screen(app, number: Optional[int]):
     metavar="<SCENE,SLIDE>",
     type=str,
     callback=start_at_callback,
-    default=(None, None),
+    default=_NO_START_AT,
     help="Start presenting at (x, y), equivalent to --sacn x --sasn y, "
     "and overrides values if not None.",
 )
@@ -262,7 +467,7 @@ def present(
     exit_after_last_slide: bool,
     hide_mouse: bool,
     aspect_ratio: str,
-    start_at: Tuple[Optional[int], Optional[int], Optional[int]],
+    start_at: Tuple[Optional[int], Optional[int]],
     start_at_scene_number: int,
     start_at_slide_number: int,
     screen_number: Optional[int],
@@ -282,14 +487,27 @@ def present(
     Use ``manim-slide list-scenes`` to list all available
     scenes in a given folder.
     """
+    # Qt and the player are only imported here, so that other commands
+    # (e.g., ``list-scenes``) do not pay for their import time.
+    from pydantic import ValidationError
+
+    from ..qt_utils import qapp
+    from .player import Player
 
     if presentation_file:
-        with open(presentation_file) as p:
-            presentation = json.loads(p.read())
-            folder = Path(presentation.get("root", "./slides"))
-            scenes = presentation.get("sequence", [])
+        presentation = json.loads(Path(presentation_file).read_bytes())
+        folder = Path(presentation.get("root", "./slides"))
+        scenes = presentation.get("sequence", [])
+
+        if not scenes:
+            raise click.UsageError(
+                f"Presentation file {presentation_file} does not contain any scene"
+            )
 
-    presentation_configs = get_scenes_presentation_config(scenes, folder)
+        # Scenes are known, so the folder never needs to be scanned
+        presentation_configs = _load_configs_strict(scenes, folder)
+    else:
+        presentation_configs = get_scenes_presentation_config(scenes, folder)
 
     if config_path.exists():
         try:
@@ -306,7 +524,15 @@ def present(
     if start_at[1]:
         start_at_slide_number = start_at[1]
 
-    slide_index = start_at_slide_number + sum([len(x.slides) for x in presentation_configs[:start_at_scene_number]])
+    if start_at_scene_number < 0:  # Same semantics as slicing with negative indices
+        start_at_scene_number = max(
+            start_at_scene_number + len(presentation_configs), 0
+        )
+
+    slide_index = start_at_slide_number + sum(
+        len(presentation_config.slides)
+        for presentation_config in islice(presentation_configs, start_at_scene_number)
+    )
     if slide_index < 0:
         logger.error("First slide is number 0")
         exit(2)
@@ -314,8 +540,9 @@ def present(
     app = qapp()
     app.setApplicationName("Manim Slides")
 
-    screen = get_screen(app, screen_number)
-    presenter_screen = get_screen(app, presenter_screen_number)
+    screens = app.screens()
+    screen = get_screen(app, screen_number, screens)
+    presenter_screen = get_screen(app, presenter_screen_number, screens)
 
     player = Player(
         config,
@@ -324,7 +551,7 @@ def present(
         full_screen=full_screen,
         exit_after_last_slide=exit_after_last_slide,
         hide_mouse=hide_mouse,
-        aspect_ratio_mode=ASPECT_RATIO_MODES[aspect_ratio],
+        aspect_ratio_mode=_aspect_ratio_modes()[aspect_ratio],
         slide_index=slide_index,
         screen=screen,
         presenter_screen=presenter_screen,
@@ -1,18 +1,121 @@
+from pathlib import Path
 from typing import Any, List, Optional
-from PySide6.QtCore import Qt, QUrl, Signal, Slot, QMargins, QTimer
-from PySide6.QtGui import QCloseEvent, QIcon, QKeyEvent, QScreen, QPixmap, QPalette, QAction, QFont
+from PySide6.QtCore import Qt, QUrl, Signal, Slot, QTimer, QAbstractListModel, QModelIndex, QRect, \
+    QSize, QObject, QRunnable, QThreadPool, QCoreApplication
+from PySide6.QtGui import QCloseEvent, QIcon, QKeyEvent, QScreen, QPixmap, QPixmapCache, QPalette, QAction, QFont, \
+    QImage, QImageReader, QPainter
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
-from PySide6.QtWidgets import QGridLayout, QLabel, QMainWindow, QScrollArea, QVBoxLayout, QHBoxLayout, QWidget, \
-    QProgressBar, QLayout, QStatusBar, QTextEdit, QMenuBar, QMenu, QInputDialog, QLineEdit, QMdiSubWindow
+from PySide6.QtWidgets import QGridLayout, QLabel, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, \
+    QStatusBar, QTextEdit, QMenuBar, QMenu, QInputDialog, QLineEdit, QMdiSubWindow, \
+    QAbstractItemView, QListView, QStyledItemDelegate
 from pydantic import FilePath
 
 from ..config import Config, PresentationConfig
 from ..logger import logger
 from ..resources import *  # noqa: F403
+from ..utils import THUMBNAIL_WIDTH, scaled_thumbnail_path
 from ..wizard import init
 
 WINDOW_NAME = "Manim Slides"
+PIXMAP_CACHE_LIMIT = 131072  # In kilobytes
+
+# Only the roles painted by SlideDelegate are set
+_SELECTED_PALETTE = QPalette()
+_SELECTED_PALETTE.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.yellow)
+_SELECTED_PALETTE.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.black)
+_SELECTED_PALETTE.setColor(QPalette.ColorRole.Mid, Qt.GlobalColor.darkYellow)  # Progress track
+
+
+def _thumbnail_key(path: FilePath) -> str:
+    """Return the QPixmapCache key of a thumbnail."""
+    return str(path)
+
+
+def _load_thumbnail(path: FilePath) -> QImage:
+    """
+    Return the thumbnail scaled to the largest width it is displayed at.
+
+    Smaller displays scale it down when painting, so that each thumbnail is
+    only decoded once. If a pre-scaled thumbnail exists, it is loaded as is.
+    Unlike QPixmap, QImage can be used outside of the GUI thread.
+    """
+    scaled_path = scaled_thumbnail_path(Path(path), THUMBNAIL_WIDTH)
+
+    if scaled_path.exists():
+        return QImage(str(scaled_path))
+
+    # Decoding at the target size avoids allocating the full resolution image
+    reader = QImageReader(str(path))
+    size = reader.size()
+
+    if size.width() > THUMBNAIL_WIDTH:
+        reader.setScaledSize(_scaled_size(size, THUMBNAIL_WIDTH))
+
+    return reader.read()
+
+
+def _image_size(path: FilePath, width: int) -> QSize:
+    """Return the size of the image scaled to a given width, only reading its header."""
+    return _scaled_size(QImageReader(str(path)).size(), width)
+
+
+def _scaled_size(size: QSize, width: int) -> QSize:
+    """Return a size scaled to a given width, keeping its aspect ratio."""
+    if size.width() <= 0:
+        return QSize(width, 0)
+
+    return QSize(width, round(size.height() * width / size.width()))
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, loaded, key, path):
+        super().__init__()
+        self.loaded = loaded
+        self.key = key
+        self.path = path
+
+    def run(self):
+        self.loaded.emit(self.key, _load_thumbnail(self.path))
+
+
+class ThumbnailLoader(QObject):
+    """
+    Loads thumbnails in worker threads, and shares them through QPixmapCache.
+
+    Images are decoded and scaled as QImages by the workers, and only converted
+    to QPixmaps on the GUI thread, which then emits :attr:`ready`.
+    """
+
+    loaded = Signal(str, QImage)
+    ready = Signal(str, QPixmap)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.__pool = QThreadPool(self)
+        self.__pending = set()
+        self.loaded.connect(self.__on_loaded)
+
+    def request(self, path: FilePath) -> Optional[QPixmap]:
+        """Return the thumbnail if it is cached, or start loading it and return None."""
+        key = _thumbnail_key(path)
+        pixmap = QPixmap()
+
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+
+        if key not in self.__pending:
+            self.__pending.add(key)
+            self.__pool.start(_ThumbnailTask(self.loaded, key, path))
+
+        return None
+
+    @Slot(str, QImage)
+    def __on_loaded(self, key, image):
+        self.__pending.discard(key)
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        self.ready.emit(key, pixmap)
 
 
 class PresentationSlide:
@@ -26,119 +129,182 @@ class PresentationSlide:
         self.notes = notes
 
 
-class SlideSequenceElement(QWidget):
-    def __init__(self, scroll_parent, index, slide, selected, mp, last):
-        super().__init__()
-        self.mp = mp
-        self.index = index
-        self.slide = slide
-        self.last = last
-        self.__scroll_parent = scroll_parent
-        self.__layout = QHBoxLayout()
-        self.__index_label = QLabel()
-        self.__img_label = QLabel()
-        self.__loop_label = QLabel()
-        self.__auto_play_label = QLabel()
-        self.__progress = QProgressBar()
-
-        self.__selected_palette = QPalette()
-        self.__palette = QPalette()
-        self.__selected_palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.yellow)
-        self.__selected_palette.setColor(self.__index_label.foregroundRole(), Qt.GlobalColor.black)
-
-        self.init_gui(index, slide, selected)
-
-    def set_index(self, i):
-        self.__index_label.setText(str(i))
-
-    def set_selected(self, selected=True):
-        self.setPalette(self.__selected_palette if selected else self.__palette)
-        self.__progress.setVisible(selected)
-        self.__scroll_parent.ensureWidgetVisible(self)
-
-    def set_position(self, perchentage):
-        self.__progress.setValue(perchentage)
-
-    def init_gui(self, i, slide, s):
-        self.setAutoFillBackground(True)
-        self.set_index(i)
-
-        indicators = QWidget()
-        vl = QVBoxLayout()
-        vl.addWidget(self.__index_label)
-
-        if slide.auto_next:
-            self.__auto_play_label.setText("A")
-
-        if slide.loop:
-            self.__auto_play_label.setText("L")
-
-        vl.addWidget(self.__loop_label)
-        vl.addWidget(self.__auto_play_label)
-        indicators.setLayout(vl)
-
-        preview = QWidget()
-        l = QVBoxLayout()
-
-        img = QPixmap(slide.thumbnail).scaledToWidth(200, Qt.TransformationMode.SmoothTransformation)
-        self.__img_label.setPixmap(img)
-
-        self.__img_label.setFixedWidth(img.width())
-        self.__img_label.setFixedHeight(img.height())
-        self.__progress.setVisible(False)
-        self.__progress.setFixedHeight(8)
-        self.__progress.setFixedWidth(img.width())
-        self.__progress.setTextVisible(False)
-        self.__progress.setValue(100 if not s else 0)
-
-        l.addWidget(self.__img_label)
-        l.addWidget(self.__progress)
-        l.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
-        l.setContentsMargins(QMargins(0, 0, 0, 0))
-        preview.setLayout(l)
-
-        self.__layout.addWidget(indicators, Qt.AlignmentFlag.AlignLeft)
-        self.__layout.addWidget(preview, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        self.setLayout(self.__layout)
-        self.set_selected(s)
-        self.__layout.setSizeConstraint(QLayout.SizeConstraint.SetFixedSize)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            play_index = max(0, self.index if not self.slide.loop else self.index - 1)
-            play_paused = not self.slide.loop
-            self.mp.load_slide(play_index, play_paused, False, True)
-            self.__progress.setValue(100)
+class SlideListModel(QAbstractListModel):
+    """Exposes the slides, and the playback state of the active one, to views."""
 
+    SlideRole = Qt.ItemDataRole.UserRole
+    ProgressRole = Qt.ItemDataRole.UserRole + 1
+    SelectedRole = Qt.ItemDataRole.UserRole + 2
 
-class SlideList(QScrollArea):
-    def __init__(self, *args, slides, mp, slide_index, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, slides, slide_index, parent=None):
+        super().__init__(parent)
         self.slides = slides
         self.active_slide = slide_index
-        self.slide_list_elements = [
-            SlideSequenceElement(self, i, s, i == self.active_slide, mp, i == len(self.slides) - 1) for i, s in
-            enumerate(self.slides)]
-        self.slide_list = QWidget(self)
-        self.layout = QVBoxLayout(self.slide_list)
-        for s in self.slide_list_elements:
-            self.layout.addWidget(s)
-        self.setWidget(self.slide_list)
-        self.setFixedWidth(self.slide_list.width() + 24)
+        self.progress = [100] * len(slides)
+        self.progress[slide_index] = 0
+
+    def rowCount(self, parent=QModelIndex()):  # noqa: N802
+        return 0 if parent.isValid() else len(self.slides)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(row)
+        if role == self.SlideRole:
+            return self.slides[row]
+        if role == self.ProgressRole:
+            return self.progress[row]
+        if role == self.SelectedRole:
+            return row == self.active_slide
+
+        return None
+
+    def set_active_slide(self, row):
+        previous = self.active_slide
+
+        if row != previous:
+            self.progress = [100] * len(self.slides)
+
+        self.active_slide = row
+        self.dataChanged.emit(self.index(previous), self.index(previous))
+        self.dataChanged.emit(self.index(row), self.index(row))
+
+    def set_progress(self, row, value):
+        if self.progress[row] == value:  # Avoids repainting the row for nothing
+            return
+
+        self.progress[row] = value
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [self.ProgressRole])
+
+
+class SlideDelegate(QStyledItemDelegate):
+    """Paints a slide row: its index and indicators, its thumbnail and its progress."""
+
+    LIST_THUMBNAIL_WIDTH = 200
+    INDICATORS_WIDTH = 24
+    PROGRESS_HEIGHT = 2
+    MARGIN = 6
+
+    def __init__(self, thumbnail_loader, thumbnail, parent=None):
+        super().__init__(parent)
+        self.__thumbnail_loader = thumbnail_loader
+
+        # All rows have the size of the first one, so only its header is read
+        size = _image_size(thumbnail, self.LIST_THUMBNAIL_WIDTH)
+        self.row_size = QSize(
+            self.INDICATORS_WIDTH + size.width() + 3 * self.MARGIN,
+            size.height() + self.PROGRESS_HEIGHT + 3 * self.MARGIN,
+        )
+
+    def sizeHint(self, option, index):  # noqa: N802
+        return self.row_size
+
+    def paint(self, painter, option, index):
+        slide = index.data(SlideListModel.SlideRole)
+        selected = index.data(SlideListModel.SelectedRole)
+        palette = _SELECTED_PALETTE if selected else option.palette
+        rect = option.rect
+
+        painter.save()
+        painter.fillRect(rect, palette.color(QPalette.ColorRole.Window))
+
+        indicators_rect = QRect(
+            rect.left() + self.MARGIN, rect.top() + self.MARGIN,
+            self.INDICATORS_WIDTH, rect.height() - 2 * self.MARGIN
+        )
+        indicator = "L" if slide.loop else "A" if slide.auto_next else ""
+        painter.setPen(palette.color(QPalette.ColorRole.WindowText))
+        painter.drawText(
+            indicators_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"{index.row()}\n{indicator}"
+        )
+
+        x = indicators_rect.right() + self.MARGIN
+        y = rect.top() + self.MARGIN
+        width = self.LIST_THUMBNAIL_WIDTH
+        height = rect.height() - self.PROGRESS_HEIGHT - 3 * self.MARGIN
+
+        # Until the thumbnail is loaded, the row is painted without it
+        pixmap = self.__thumbnail_loader.request(slide.thumbnail)
+
+        # Rows share the first slide's size, but each thumbnail keeps its aspect ratio
+        if pixmap is not None:
+            size = pixmap.size().scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio)
+            target = QRect(
+                x + (width - size.width()) // 2, y + (height - size.height()) // 2, size.width(), size.height()
+            )
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.drawPixmap(target, pixmap)
+
+        # The progress is a plain track and fill, rather than a styled progress bar
+        if selected:
+            track = QRect(x, y + height + self.MARGIN, width, self.PROGRESS_HEIGHT)
+            painter.fillRect(track, palette.color(QPalette.ColorRole.Mid))
+            track.setWidth(width * index.data(SlideListModel.ProgressRole) // 100)
+            painter.fillRect(track, palette.color(QPalette.ColorRole.WindowText))
+
+        painter.restore()
+
+
+class SlideList(QListView):
+    def __init__(self, *args, slides, mp, slide_index, thumbnail_loader, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mp = mp
+        self.slide_model = SlideListModel(slides, slide_index, self)
+        self.setModel(self.slide_model)
+        delegate = SlideDelegate(thumbnail_loader, slides[0].thumbnail, self)
+        self.setItemDelegate(delegate)
+        thumbnail_loader.ready.connect(self.thumbnail_ready)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setFixedWidth(
+            delegate.row_size.width() + self.verticalScrollBar().sizeHint().width() + 2 * self.frameWidth()
+        )
+        self.clicked.connect(self.slide_clicked)
+        self.scrollTo(self.slide_model.index(slide_index), QAbstractItemView.ScrollHint.PositionAtCenter)
+
+    @property
+    def slides(self):
+        return self.slide_model.slides
+
+    @property
+    def active_slide(self):
+        return self.slide_model.active_slide
+
+    @Slot(str, QPixmap)
+    def thumbnail_ready(self, key, pixmap):
+        self.viewport().update()
+
+    @Slot(QModelIndex)
+    def slide_clicked(self, index):
+        row = index.row()
+        slide = self.slides[row]
+        play_index = max(0, row if not slide.loop else row - 1)
+        play_paused = not slide.loop
+        self.mp.load_slide(play_index, play_paused, False, True)
+        self.slide_model.set_progress(row, 100)
 
     def set_active_slide(self, index):
-        for i, s in enumerate(self.slide_list_elements):
-            if not ((index == self.active_slide) and (index == i)):
-                s.set_position(100)
-        self.slide_list_elements[self.active_slide].set_selected(False)
-        self.slide_list_elements[index].set_selected(True)
-        self.active_slide = index
+        changed = index != self.slide_model.active_slide
+        self.slide_model.set_active_slide(index)
+
+        # With uniform item sizes, scrolling to a row does not lay out the others
+        if changed:
+            self.scrollTo(self.slide_model.index(index), QAbstractItemView.ScrollHint.EnsureVisible)
 
     def slide_play_position_updated(self, index, perchentage):
-        index = max(min(index, len(self.slide_list_elements) - 1), 0)
-        self.slide_list_elements[index].set_position(perchentage)
+        # The position of a reversed transition can point one past the last slide
+        if index < 0 or index >= len(self.slides):
+            return
+
+        self.slide_model.set_progress(index, perchentage)
 
 
 class Timer(QLabel):
@@ -197,23 +363,30 @@ class Timer(QLabel):
 
 
 class SlideInfo(QWidget):
-    def __init__(self, slide, next_slide, start_paused):
+    NEXT_THUMBNAIL_WIDTH = 380
+
+    def __init__(self, slide, next_slide, start_paused, thumbnail_loader):
         super().__init__()
 
         self.__cur_slide_label = QLabel()
         self.__next_slide_label = QLabel()
-        self.__cur_img = QPixmap()
-        self.__next_img = QPixmap()
+        self.__cur_key = None
+        self.__next_key = None
         self.timer = Timer(start_paused)
         self.__notes = QTextEdit()
         self.__layout = QVBoxLayout()
+        self.__pending_next = None
+        self.__next_scheduled = False
+        self.__thumbnail_loader = thumbnail_loader
+        self.__thumbnail_loader.ready.connect(self.__thumbnail_ready)
 
         self.init_gui()
         self.set_cur_slide(slide, next_slide)
 
     def init_gui(self):
-        self.__cur_slide_label.setPixmap(self.__cur_img)
-        self.__next_slide_label.setPixmap(self.__next_img)
+        # Both labels share the same thumbnails, scaled when painted
+        self.__cur_slide_label.setScaledContents(True)
+        self.__next_slide_label.setScaledContents(True)
 
         top_layout = QHBoxLayout()
         next_slide_layout = QVBoxLayout()
@@ -237,21 +410,46 @@ class SlideInfo(QWidget):
         self.__notes.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
     def set_cur_slide(self, slide, next_slide):
-        self.__cur_img = QPixmap(slide.thumbnail).scaledToWidth(600, Qt.TransformationMode.SmoothTransformation)
-        self.__cur_slide_label.setPixmap(self.__cur_img)
-        self.__cur_slide_label.setFixedWidth(self.__cur_img.width())
-        self.__cur_slide_label.setFixedHeight(self.__cur_img.height())
+        self.__cur_key = self.__set_thumbnail(self.__cur_slide_label, slide, THUMBNAIL_WIDTH)
         self.__notes.setMarkdown(slide.notes)
 
-        if next_slide is None:
-            self.__next_img = QPixmap()
-            self.__next_slide_label.setPixmap(self.__next_img)
-            return
+        # The next slide is loaded once control returns to the event loop,
+        # so that it does not delay the transition that is starting.
+        # If slides change again before, only the most recent one is loaded.
+        self.__pending_next = next_slide
+
+        if not self.__next_scheduled:
+            self.__next_scheduled = True
+            QTimer.singleShot(0, self.__set_next_slide)
+
+    @Slot()
+    def __set_next_slide(self):
+        self.__next_scheduled = False
+        self.__next_key = self.__set_thumbnail(self.__next_slide_label, self.__pending_next, self.NEXT_THUMBNAIL_WIDTH)
+
+    def __set_thumbnail(self, label, slide, width):
+        """Show the thumbnail of a slide in a label, or clear it until it is loaded."""
+        if slide is None:
+            label.clear()
+            return None
+
+        label.setFixedSize(_image_size(slide.thumbnail, width))
+        pixmap = self.__thumbnail_loader.request(slide.thumbnail)
+
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+        else:
+            label.clear()
 
-        self.__next_img = QPixmap(next_slide.thumbnail).scaledToWidth(380, Qt.TransformationMode.SmoothTransformation)
-        self.__next_slide_label.setPixmap(self.__next_img)
-        self.__next_slide_label.setFixedWidth(self.__next_img.width())
-        self.__next_slide_label.setFixedHeight(self.__next_img.height())
+        return _thumbnail_key(slide.thumbnail)
+
+    @Slot(str, QPixmap)
+    def __thumbnail_ready(self, key, pixmap):
+        if key == self.__cur_key:
+            self.__cur_slide_label.setPixmap(pixmap)
+
+        if key == self.__next_key:
+            self.__next_slide_label.setPixmap(pixmap)
 
 
 class Info(QMainWindow):  # type: ignore[misc]
@@ -261,11 +459,16 @@ class Info(QMainWindow):  # type: ignore[misc]
         self.slides = slides
         self.config = config
         self.slide_load_signal = slide_load_signal
-        self.slide_list_widget = SlideList(self, slides=self.slides, mp=self.parent().media_player,
-                                           slide_index=start_slide)
-        self.slide_info = SlideInfo(self.slides[start_slide],
-                                    self.slides[start_slide + 1] if start_slide < len(self.slides) - 1 else None,
-                                    start_paused)
+        self.mp = self.parent().media_player
+        self.__last_position = None
+        self.__last_cur_index = None
+        # Refreshed when the source changes, instead of queried on every position tick
+        self.__duration = max(1, self.mp.duration())
+        self.thumbnail_loader = ThumbnailLoader(self)
+        self.slide_list_widget = SlideList(self, slides=self.slides, mp=self.mp,
+                                           slide_index=start_slide, thumbnail_loader=self.thumbnail_loader)
+        self.slide_info = SlideInfo(self.slides[start_slide], self.__next_of(start_slide), start_paused,
+                                    self.thumbnail_loader)
 
         w = QWidget()
         self.__layout = QGridLayout()
@@ -286,7 +489,8 @@ class Info(QMainWindow):  # type: ignore[misc]
             self.move(presenter_screen.geometry().center())
 
         self.slide_load_signal.connect(self.on_slide_changed)
-        self.parent().media_player.positionChanged.connect(self.position_changed)
+        self.mp.positionChanged.connect(self.position_changed)
+        self.mp.durationChanged.connect(self.duration_changed)
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
         self.build_menu()
         self.setWindowTitle(f"{WINDOW_NAME} - Presenter View")
@@ -352,23 +556,45 @@ class Info(QMainWindow):  # type: ignore[misc]
 
     @Slot()
     def position_changed(self, position):
-        mp = self.parent().media_player
-        index = mp.slide_index + (1 if not mp.playingForward else 0)
-        perch = int((position / mp.duration()) * 100)
-        self.slide_list_widget.slide_play_position_updated(index, 100 - perch if not mp.playingForward else perch)
+        mp = self.mp
+        forward = mp.playingForward
+        index = mp.slide_index if forward else mp.slide_index + 1
+        # The cached duration can be stale until the new source reports its own
+        perch = max(0, min(100, (position * 100) // self.__duration))
+
+        # Positions are emitted far more often than the percentage changes
+        if (index, perch) == self.__last_position:
+            return
+
+        self.__last_position = (index, perch)
+        self.slide_list_widget.slide_play_position_updated(index, perch if forward else 100 - perch)
+
+    @Slot(int)
+    def duration_changed(self, duration):
+        self.__duration = max(1, duration)
 
     @Slot()
     def on_slide_changed(self):
-        mp = self.parent().media_player
+        mp = self.mp
+        self.__duration = max(1, mp.duration())
         cur_index = mp.slide_index
         if mp.position() == 0 and not mp.isPlaying():
             cur_index -= 1
 
         cur_index = max(cur_index, 0)
-        self.status_bar.showMessage(f"Slides: {cur_index} of {len(self.slides)}")
         self.slide_list_widget.set_active_slide(cur_index)
-        self.slide_info.set_cur_slide(self.slides[cur_index],
-                                      self.slides[cur_index + 1] if cur_index < len(self.slides) - 1 else None)
+
+        # Reloading the same slide leaves the notes and thumbnails as they are
+        if cur_index == self.__last_cur_index:
+            return
+
+        self.__last_cur_index = cur_index
+        self.status_bar.showMessage(f"Slides: {cur_index} of {len(self.slides)}")
+        self.slide_info.set_cur_slide(self.slides[cur_index], self.__next_of(cur_index))
+
+    def __next_of(self, index):
+        """Return the slide after the given index, or None if it is the last one."""
+        return self.slides[index + 1] if index + 1 < len(self.slides) else None
 
     def keyPressEvent(self, arg__1):
         self.parent().keyPressEvent(arg__1)
@@ -386,12 +612,19 @@ class PresentationPlayer(QMediaPlayer):
         self.setVideoOutput(self.video_player)
         self.setPlaybackRate(playback_rate)
         self.slides = slides
+        # Flags read on every transition, as plain lists
+        self.__loops = [slide.loop for slide in slides]
+        self.exit_after_last_slide = exit_after_last_slide
+        # What to do when each slide's transition ends while playing forward, decided once
+        self.__forward_ends = [self.next if slide.auto_next else None for slide in slides]
+        if slides and exit_after_last_slide and self.__forward_ends[-1] is None:
+            self.__forward_ends[-1] = self.__quit
+        self.__on_end = None
         self.slide_index = start_slide
         self.slide_load_signal = slide_load_signal
         self.playingForward = True
         self.load_slide(self.slide_index, start_paused, False)
         self.mediaStatusChanged.connect(self.media_finished)
-        self.exit_after_last_slide = exit_after_last_slide
 
     @Slot()
     def media_finished(self, status):
@@ -399,35 +632,36 @@ class PresentationPlayer(QMediaPlayer):
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
             logger.debug("Transition finished")
 
-            # If we do not need to loop then ensure no looping on the player
-            if not self.slides[self.slide_index].loop or not self.playingForward:
-                self.setLoops(1)  # do not loop anymore
+            # Chosen by load_slide, so that no slide flag is checked here
+            if self.__on_end is not None:
+                self.__on_end()
 
-            # If the slide is set on auto_loop, then execute next callback if we weren't playing it in reverse.
-            if self.slides[self.slide_index].auto_next and self.playingForward:
-                return self.next()
+    def __quit(self):
+        # Release the media backend, then leave the event loop normally
+        self.stop()
+        QCoreApplication.quit()
 
-            if self.slide_index == len(self.slides) - 1 and self.exit_after_last_slide:
-                exit(0)
-
-            if not self.playingForward and self.slide_index >= 0:
-                return self.load_slide(self.slide_index, True, False, True)
-            # self.load_slide(self.slide_index + 1, True, False)
+    def __rewound(self):
+        # A reversed transition ends on the previous slide, ready to be played again
+        if self.slide_index >= 0:
+            self.load_slide(self.slide_index, True, False, True)
 
     def load_slide(self, index, paused=False, reversed=False, end=False):
         """Loads the i-th slide and updates the internal reference index"""
         if index >= len(self.slides):
-            logger.warn("No more slides!")
+            logger.warning("No more slides!")
             return
         if index < 0:
-            logger.warn("No previous slides!")
+            logger.warning("No previous slides!")
             return
 
         slide = self.slides[index]
         self.slide_index = index
         self.playingForward = not reversed
         logger.debug(
-            f"Slide {index} loaded, PAUSED={paused}, REVERSE={reversed}, LOOP={slide.loop}, AUTO_NEXT={slide.auto_next}")
+            "Slide %d loaded, PAUSED=%s, REVERSE=%s, LOOP=%s, AUTO_NEXT=%s",
+            index, paused, reversed, slide.loop, slide.auto_next,
+        )
 
         # Load the resource
         url = QUrl.fromLocalFile(slide.file if not reversed else slide.rev_file)
@@ -435,6 +669,7 @@ class PresentationPlayer(QMediaPlayer):
 
         # If the slide requires looping then set the looping method
         self.setLoops(-1 if slide.loop and not reversed else 1)
+        self.__on_end = self.__rewound if reversed else self.__forward_ends[index]
 
         if end:
             self.setPosition(self.duration())
@@ -481,7 +716,7 @@ class PresentationPlayer(QMediaPlayer):
     def previous(self):
         if self.isPlaying():
             # If we are playing in a looping slide we will play the reverse of it from the current duration
-            if self.slides[self.slide_index].loop:
+            if self.__loops[self.slide_index]:
                 self.pause()
                 rev_position = self.duration() - self.position()
                 self.load_slide(self.slide_index, False, True)
@@ -510,7 +745,7 @@ class PresentationPlayer(QMediaPlayer):
         return self.video_player
 
     def isLooping(self):
-        return self.isPlaying() and self.slides[self.slide_index].loop
+        return self.isPlaying() and self.__loops[self.slide_index]
 
     def isPlayingForward(self):
         return self.isPlaying() and self.playingForward
@@ -523,12 +758,15 @@ class PresentationPlayer(QMediaPlayer):
 
 
 def load_presentation(presentation_configs: List[PresentationConfig]):
-    slides = []
-    resolution = (0, 0)
-    for p in presentation_configs:
-        resolution = (max(p.resolution[0], resolution[0]), max(p.resolution[1], resolution[1]))
-        for s in p.slides:
-            slides.append(PresentationSlide(s.file, s.rev_file, s.thumbnail, s.loop, s.auto_next, s.notes))
+    slides = [
+        PresentationSlide(s.file, s.rev_file, s.thumbnail, s.loop, s.auto_next, s.notes)
+        for p in presentation_configs
+        for s in p.slides
+    ]
+    resolution = (
+        max((p.resolution[0] for p in presentation_configs), default=0),
+        max((p.resolution[1] for p in presentation_configs), default=0),
+    )
     return slides, resolution
 
 
@@ -556,6 +794,8 @@ class Player(QMainWindow):
         # Wizard's config
         self.config = config
 
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT)
+
         self.slides, self.resolution = load_presentation(presentation_configs)
         self.setup_window(screen, full_screen, hide_mouse)
         self.media_player = PresentationPlayer(self, aspect_ratio_mode, playback_rate, self.slides,
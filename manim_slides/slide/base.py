@@ -12,7 +12,13 @@ from tqdm import tqdm
 from ..config import PresentationConfig, PreSlideConfig, SlideConfig
 from ..defaults import FFMPEG_BIN, FOLDER_PATH
 from ..logger import logger
-from ..utils import concatenate_video_files, merge_basenames, reverse_video_file, generate_slide_thumbnail
+from ..utils import (
+    concatenate_video_files,
+    generate_scaled_thumbnails,
+    generate_slide_thumbnail,
+    merge_basenames,
+    reverse_video_file,
+)
 from . import MANIM
 from manim import config
 
@@ -454,6 +460,9 @@ class BaseSlide:
             if not use_cache or not thumbnail_file.exists():
                 generate_slide_thumbnail(self._ffmpeg_bin, dst_file, thumbnail_file)
 
+            # We pre-scale the thumbnail at the sizes used by the presenter window
+            generate_scaled_thumbnails(thumbnail_file, use_cache=use_cache)
+
             # We generate the note text based on the full slide notes in the doc
             note = notes[0]
             if len(notes) > i + 1:
@@ -1,28 +1,110 @@
 __all__ = ["Presentation"]
 
+import importlib
 import json
+import multiprocessing
+import pickle
 from pathlib import Path
-from typing import List, Any, Type
+from typing import List, Any, Tuple, Type
 from manim import Scene
 
 from manim_slides.defaults import FOLDER_PATH
+from manim_slides.logger import logger
 from manim_slides.slide import Slide
 
 
+def _import_slide_class(module: str, qualname: str) -> Type[Slide]:
+    """Return a slide class from its module and qualified name."""
+    obj = importlib.import_module(module)
+
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+
+    return obj  # type: ignore
+
+
+def _render_slide(task: Tuple[str, str, Tuple[Any, ...], dict, bool]) -> bool:
+    """
+    Render one slide class in a worker process.
+
+    Return False if the class cannot be imported in the worker, e.g., if it
+    is defined inside a function and processes are spawned, so that the
+    caller can render it itself.
+    """
+    module, qualname, args, kwargs, preview = task
+
+    try:
+        SlideClass = _import_slide_class(module, qualname)
+    except (ImportError, AttributeError):
+        return False
+
+    SlideClass(*args, **kwargs).render(preview=preview)
+    return True
+
+
 class Presentation(Scene):
-    def __init__(self, *args, slides: List[Type[Slide]], output_path=FOLDER_PATH, name="presentation", **kwargs: Any):
+    def __init__(self, *args, slides: List[Type[Slide]], output_path=FOLDER_PATH, name="presentation",
+                 parallel: bool = False, **kwargs: Any):
         super().__init__(*args, **kwargs)
         self.list = slides
         self.output_path = output_path
         self.name = name
+        self.parallel = parallel
         self.args = args
         self.kwargs = kwargs
 
+    def __render_in_pool(self, preview: bool) -> List[bool]:
+        """
+        Render the slides in a pool of processes, returning which ones were rendered.
+
+        Workers are forked, so that they inherit manim's global config, e.g.,
+        the quality or the media folder set from the command line. They only
+        receive where to import each class from, and the constructor arguments.
+        If processes cannot be forked, if a renderer is given, or if the
+        arguments cannot be pickled, nothing is rendered.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            logger.debug("Processes cannot be forked, rendering slides sequentially")
+            return [False] * len(self.list)
+
+        if self.kwargs.get("renderer") is not None or (self.args and self.args[0] is not None):
+            return [False] * len(self.list)
+
+        tasks = [
+            (SlideClass.__module__, SlideClass.__qualname__, self.args, self.kwargs, preview)
+            for SlideClass in self.list
+        ]
+
+        try:
+            pickle.dumps(tasks)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug("Could not send the slides to worker processes: %s", e)
+            return [False] * len(self.list)
+
+        with multiprocessing.get_context("fork").Pool() as pool:
+            return pool.map(_render_slide, tasks, chunksize=1)
+
     def render(self, preview: bool = False):
-        presentation_obj = {"root": self.output_path, "sequence": []}
-        for SlideClass in self.list:
-            presentation_obj["sequence"].append(SlideClass.__name__)
-            SlideClass(*self.args, **self.kwargs).render(preview=preview)
+        """
+        Render every slide, then write the presentation file.
+
+        If ``parallel=True`` was passed, slides are rendered in a pool of
+        processes. As they share manim's Tex and text caches, this is opt-in.
+        Slides that cannot be rendered by the pool are rendered sequentially.
+        """
+        presentation_obj = {
+            "root": str(self.output_path),
+            "sequence": [SlideClass.__name__ for SlideClass in self.list],
+        }
+
+        if self.parallel and len(self.list) > 1:
+            rendered = self.__render_in_pool(preview)
+        else:
+            rendered = [False] * len(self.list)
+
+        for SlideClass, done in zip(self.list, rendered):
+            if not done:
+                SlideClass(*self.args, **self.kwargs).render(preview=preview)
 
         with open(Path(self.output_path, f"{self.name}.json"), "w") as out:
-            out.write(json.dumps(presentation_obj))
+            json.dump(presentation_obj, out, separators=(",", ":"))
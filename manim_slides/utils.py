@@ -2,10 +2,15 @@ import hashlib
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
+
+from PIL import Image
 
 from .logger import logger
 
+THUMBNAIL_WIDTH: int = 600
+"""Largest width at which thumbnails are displayed in the presenter window."""
+
 
 def concatenate_video_files(ffmpeg_bin: Path, files: List[Path], dest: Path) -> None:
     """Concatenate multiple video files into one."""
@@ -89,3 +94,24 @@ def generate_slide_thumbnail(ffmpeg_bin: Path, src: Path, dst: Path):
 
     if error:
         logger.debug(error.decode())
+
+
+def scaled_thumbnail_path(thumbnail: Path, width: int) -> Path:
+    """Return the path of a thumbnail, scaled to a given width."""
+    return thumbnail.with_name(f"{thumbnail.stem}.{width}{thumbnail.suffix}")
+
+
+def generate_scaled_thumbnails(
+    thumbnail: Path, widths: Iterable[int] = (THUMBNAIL_WIDTH,), use_cache: bool = True
+) -> None:
+    """Write downscaled copies of a thumbnail, next to it, for each width."""
+    with Image.open(thumbnail) as im:
+        for width in widths:
+            dst = scaled_thumbnail_path(thumbnail, width)
+
+            if use_cache and dst.exists():
+                continue
+
+            height = max(1, round(im.height * width / im.width))
+            im.resize((width, height), Image.LANCZOS).save(dst)
+            logger.debug(f"Generated thumbnail {dst}")
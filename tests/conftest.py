@@ -23,6 +23,15 @@ def data_folder(tests_folder: Path) -> Iterator[Path]:
     yield (tests_folder / "data").resolve(strict=True)
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("MANIM_SLIDES_CACHE_DIR", str(cache_dir))
+    yield cache_dir
+
+
 @pytest.fixture(scope="session")
 def slides_folder(data_folder: Path) -> Iterator[Path]:
     yield (data_folder / "slides").resolve(strict=True)
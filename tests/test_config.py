@@ -1,3 +1,5 @@
+import json
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -24,6 +26,41 @@ class TestPresentationConfig:
         obj = presentation_config.model_dump()
         _ = PresentationConfig.model_validate(obj)
 
+    def test_from_file_resolves_relative_paths(self, tmp_path: Path) -> None:
+        files_folder = tmp_path / "slides" / "files"
+        files_folder.mkdir(parents=True)
+        for name in ("slide.mp4", "slide_reversed.mp4", "slide_thumb.png"):
+            (files_folder / name).touch()
+
+        thumbnail = files_folder / "slide_thumb.png"
+        config_file = tmp_path / "slides" / "Scene.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "slides": [
+                        {
+                            "file": "slides/files/slide.mp4",
+                            "rev_file": "slides/files/slide_reversed.mp4",
+                            "thumbnail": str(thumbnail),
+                        }
+                    ]
+                }
+            )
+        )
+
+        config = PresentationConfig.from_file(config_file)
+        slide = config.slides[0]
+
+        assert slide.file == files_folder / "slide.mp4"
+        assert slide.rev_file == files_folder / "slide_reversed.mp4"
+        assert slide.thumbnail == thumbnail
+        assert slide.file.is_absolute()
+        assert slide.rev_file.is_absolute()
+
+    def test_from_invalid_bytes(self) -> None:
+        with pytest.raises(ValidationError):
+            _ = PresentationConfig.from_bytes(b"not a json file")
+
     def test_bump_to_json(self, presentation_config: PresentationConfig) -> None:
         _ = presentation_config.model_dump_json(indent=2)
 
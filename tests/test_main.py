@@ -94,3 +94,17 @@ def test_list_scenes(slides_folder: Path) -> None:
 
         assert results.exit_code == 0
         assert "BasicSlide" in results.output
+
+
+def test_list_scenes_from_envvar(slides_folder: Path) -> None:
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        results = runner.invoke(
+            cli,
+            ["-S", "list-scenes"],
+            env={"MANIM_SLIDES_LIST_SCENES_FOLDER": str(slides_folder)},
+        )
+
+        assert results.exit_code == 0
+        assert "BasicSlide" in results.output
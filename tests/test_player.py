@@ -1 +1,67 @@
-# TODO
+from typing import Any, List
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from manim_slides.present.player import SlideListModel
+
+
+@pytest.fixture
+def model(qtbot: QtBot) -> SlideListModel:
+    return SlideListModel(["first", "second", "third"], 0)
+
+
+@pytest.fixture
+def changes(model: SlideListModel) -> List[Any]:
+    changes: List[Any] = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles=(): changes.append(
+            (top_left.row(), list(roles))
+        )
+    )
+    return changes
+
+
+class TestSlideListModel:
+    def test_initial_state(self, model: SlideListModel) -> None:
+        assert model.rowCount() == 3
+        assert model.active_slide == 0
+        assert model.progress == [0, 100, 100]
+        assert model.index(0).data(SlideListModel.SelectedRole)
+        assert not model.index(1).data(SlideListModel.SelectedRole)
+        assert model.index(1).data(SlideListModel.SlideRole) == "second"
+
+    def test_set_active_slide_resets_progress(self, model: SlideListModel) -> None:
+        model.set_progress(0, 50)
+        model.set_active_slide(1)
+
+        assert model.active_slide == 1
+        assert model.progress == [100, 100, 100]
+        assert not model.index(0).data(SlideListModel.SelectedRole)
+        assert model.index(1).data(SlideListModel.SelectedRole)
+
+    def test_set_active_slide_unchanged_row_keeps_progress(
+        self, model: SlideListModel, changes: List[Any]
+    ) -> None:
+        model.set_progress(0, 50)
+        changes.clear()
+
+        model.set_active_slide(0)
+
+        assert model.active_slide == 0
+        assert model.progress == [50, 100, 100]
+        assert [row for row, _ in changes] == [0, 0]
+
+    def test_set_progress(self, model: SlideListModel, changes: List[Any]) -> None:
+        model.set_progress(1, 30)
+
+        assert model.index(1).data(SlideListModel.ProgressRole) == 30
+        assert changes == [(1, [SlideListModel.ProgressRole])]
+
+    def test_set_progress_unchanged_value(
+        self, model: SlideListModel, changes: List[Any]
+    ) -> None:
+        model.set_progress(0, 0)
+        model.set_progress(1, 100)
+
+        assert changes == []
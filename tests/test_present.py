@@ -1,11 +1,21 @@
+import importlib
+import json
 from pathlib import Path
-from typing import Iterator, Tuple
+from typing import Any, Iterator, List, Tuple
 
+import click
 import pytest
 from click.testing import CliRunner
 from PySide6.QtWidgets import QApplication
 
-from manim_slides.present import present
+from manim_slides.present import (
+    _iter_scenes,
+    _manifest_path,
+    present,
+    prompt_for_scenes,
+)
+
+present_module = importlib.import_module("manim_slides.present")
 
 
 @pytest.fixture(autouse=True)
@@ -44,6 +54,19 @@ def test_present_unexisting_slide(args: Tuple[str, ...]) -> None:
         assert "UnexistingSlide.json does not exist" in results.stdout
 
 
+def test_present_unexisting_slides(args: Tuple[str, ...]) -> None:
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        results = runner.invoke(
+            present, ["UnexistingSlide", "OtherUnexistingSlide", *args]
+        )
+
+        assert results.exit_code != 0
+        assert "UnexistingSlide.json" in results.stdout
+        assert "OtherUnexistingSlide.json" in results.stdout
+
+
 def test_present_full_screen(args: Tuple[str, ...]) -> None:
     runner = CliRunner()
 
@@ -139,3 +162,108 @@ def test_present_set_invalid_screen(args: Tuple[str, ...]) -> None:
 
         assert results.exit_code == 0
         assert "Invalid screen number 999" in results.stdout
+
+
+@pytest.fixture
+def scenes_folder(tmp_path: Path) -> Iterator[Path]:
+    folder = tmp_path / "slides"
+    folder.mkdir()
+    (folder / "Scene.json").write_text('{"slides": []}')
+    (folder / "NotAScene.json").write_text('{"other": []}')
+    (folder / "Broken.json").write_text("{")
+    yield folder
+
+
+@pytest.fixture
+def reads(monkeypatch: pytest.MonkeyPatch) -> Iterator[List[str]]:
+    reads: List[str] = []
+    is_scene_config = present_module._is_scene_config
+
+    def counting_is_scene_config(path: str) -> bool:
+        reads.append(Path(path).name)
+        return is_scene_config(path)
+
+    monkeypatch.setattr(present_module, "_is_scene_config", counting_is_scene_config)
+    yield reads
+
+
+class TestScenesManifest:
+    def test_manifest_is_written_in_cache(
+        self, scenes_folder: Path, cache_dir: Path
+    ) -> None:
+        assert list(_iter_scenes(scenes_folder)) == ["Scene"]
+
+        manifest_path = _manifest_path(scenes_folder)
+        assert manifest_path.is_file()
+        assert cache_dir in manifest_path.parents
+        assert sorted(path.name for path in scenes_folder.iterdir()) == [
+            "Broken.json",
+            "NotAScene.json",
+            "Scene.json",
+        ]
+
+    def test_unchanged_files_are_not_read_again(
+        self, scenes_folder: Path, reads: List[str]
+    ) -> None:
+        assert list(_iter_scenes(scenes_folder)) == ["Scene"]
+        assert sorted(reads) == ["Broken.json", "NotAScene.json", "Scene.json"]
+
+        reads.clear()
+
+        assert list(_iter_scenes(scenes_folder)) == ["Scene"]
+        assert reads == []
+
+    def test_changed_file_is_read_again(
+        self, scenes_folder: Path, reads: List[str]
+    ) -> None:
+        _ = list(_iter_scenes(scenes_folder))
+        reads.clear()
+
+        (scenes_folder / "NotAScene.json").write_text('{"slides": [], "other": []}')
+
+        assert sorted(_iter_scenes(scenes_folder)) == ["NotAScene", "Scene"]
+        assert reads == ["NotAScene.json"]
+
+    def test_unparseable_file_is_reported_every_time(
+        self, scenes_folder: Path, reads: List[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        warnings: List[Tuple[Any, ...]] = []
+        monkeypatch.setattr(
+            present_module.logger, "warning", lambda *args: warnings.append(args)
+        )
+
+        _ = list(_iter_scenes(scenes_folder))
+        reads.clear()
+        _ = list(_iter_scenes(scenes_folder))
+
+        assert reads == []
+        assert len(warnings) == 2
+        assert all("Broken.json" in args for args in warnings)
+
+    def test_version_mismatch_reads_all_files(
+        self, scenes_folder: Path, reads: List[str]
+    ) -> None:
+        _ = list(_iter_scenes(scenes_folder))
+        reads.clear()
+
+        manifest_path = _manifest_path(scenes_folder)
+        manifest = json.loads(manifest_path.read_text())
+        manifest["version"] = -1
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert list(_iter_scenes(scenes_folder)) == ["Scene"]
+        assert sorted(reads) == ["Broken.json", "NotAScene.json", "Scene.json"]
+
+
+def test_prompt_for_scenes_until_valid(scenes_folder: Path) -> None:
+    @click.command()
+    def select() -> None:
+        click.echo(f"Selected: {prompt_for_scenes(scenes_folder)}")
+
+    runner = CliRunner()
+    results = runner.invoke(select, input="abc\n0\n1\n")
+
+    assert results.exit_code == 0
+    assert "Please enter a comma separated list of numbers" in results.output
+    assert "Please only enter numbers displayed on the screen." in results.output
+    assert "Selected: ['Scene']" in results.output
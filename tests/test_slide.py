@@ -1,3 +1,4 @@
+import json
 import random
 import shutil
 import subprocess
@@ -26,6 +27,7 @@ from pydantic import ValidationError
 from manim_slides.config import PresentationConfig
 from manim_slides.defaults import FOLDER_PATH
 from manim_slides.slide.manim import Slide
+from manim_slides.slide.presentation import Presentation
 
 
 @click.command(
@@ -86,6 +88,35 @@ def test_render_basic_slide(
         assert local_presentation_config.resolution == presentation_config.resolution
 
 
+class FirstPresentationSlide(Slide):
+    def construct(self) -> None:
+        self.play(GrowFromCenter(Circle(color=BLUE)))
+
+
+class SecondPresentationSlide(Slide):
+    def construct(self) -> None:
+        self.play(FadeIn(Dot()))
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_render_presentation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, parallel: bool
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    slides = [FirstPresentationSlide, SecondPresentationSlide]
+
+    Presentation(slides=slides, output_path=tmp_path, parallel=parallel).render()
+
+    presentation = json.loads((tmp_path / "presentation.json").read_text())
+    assert presentation["sequence"] == [
+        "FirstPresentationSlide",
+        "SecondPresentationSlide",
+    ]
+
+    for name in presentation["sequence"]:
+        assert (tmp_path / FOLDER_PATH / f"{name}.json").is_file()
+
+
 def assert_constructs(cls: type) -> type:
     class Wrapper:
         @classmethod
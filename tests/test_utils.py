@@ -1,7 +1,13 @@
 from pathlib import Path
 from typing import List
 
-from manim_slides.utils import merge_basenames
+from PIL import Image
+
+from manim_slides.utils import (
+    generate_scaled_thumbnails,
+    merge_basenames,
+    scaled_thumbnail_path,
+)
 
 
 def test_merge_basenames(paths: List[Path]) -> None:
@@ -21,3 +27,17 @@ def test_merge_basenames_same_with_different_parent_directories(
     p4 = d2 / "d/e/f/two.txt"
 
     assert merge_basenames([p1, p2]).name == merge_basenames([p3, p4]).name
+
+
+def test_generate_scaled_thumbnails(tmp_path: Path) -> None:
+    thumbnail = tmp_path / "slide_thumb.png"
+    Image.new("RGB", (1920, 1080)).save(thumbnail)
+
+    generate_scaled_thumbnails(thumbnail, widths=(200, 600))
+
+    for width in (200, 600):
+        scaled = scaled_thumbnail_path(thumbnail, width)
+        assert scaled == tmp_path / f"slide_thumb.{width}.png"
+
+        with Image.open(scaled) as im:
+            assert im.size == (width, round(1080 * width / 1920))